@@ -38,12 +38,21 @@ try:
 except ImportError:
     HAS_FUSION = False
 
-from os import environ
+from os import environ, path, remove
+import hashlib
+import json
 import platform
+import threading
+import time
 
 TOKEN_EXCHANGE_URL = "https://api.pure1.purestorage.com/oauth2/1.0/token"
 VERSION = 1.0
 USER_AGENT_BASE = "Ansible"
+# how long (in seconds) a resource found to exist is trusted without asking the API again
+EXISTENCE_CACHE_TTL = 300
+
+# lookups may run concurrently, guards the read-modify-write of the cache file
+_existence_cache_lock = threading.Lock()
 
 
 def get_fusion(module):
@@ -100,3 +109,103 @@ def fusion_argument_spec():
         app_id=dict(no_log=True),
         key_file=dict(no_log=False),
     )
+
+
+def _existence_cache_file(module):
+    cache_dir = environ.get("ANSIBLE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    app_id = module.params["app_id"] or environ.get("FUSION_APP_ID", "")
+    # resources of one API host must not be trusted for another one
+    host = environ.get("FUSION_HOST", "")
+    # app_id is a secret, only its digest may end up on disk
+    digest = hashlib.sha256("{0}@{1}".format(app_id, host).encode("utf-8")).hexdigest()
+    return path.join(cache_dir, "fusion_az_{0}.json".format(digest))
+
+
+def _load_existence_cache_file(cache_file):
+    try:
+        with open(cache_file) as f:
+            entries = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    # a corrupted or foreign file is treated as an empty cache
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return dict(
+        (key, stamp)
+        for key, stamp in entries.items()
+        if isinstance(stamp, (int, float)) and 0 <= now - stamp < EXISTENCE_CACHE_TTL
+    )
+
+
+def _store_existence_cache_file(cache_file, entries):
+    try:
+        with open(cache_file, "w") as f:
+            json.dump(entries, f)
+    except (IOError, OSError):
+        pass
+
+
+def invalidate_existence_cache(module):
+    """Forgets about all resources previously found to exist"""
+    cache_file = _existence_cache_file(module)
+    if not cache_file:
+        return
+    with _existence_cache_lock:
+        try:
+            remove(cache_file)
+        except (IOError, OSError):
+            pass
+
+
+def _existence_cache_key(key):
+    return "/".join(key)
+
+
+def get_known_existing(module):
+    """Returns set of keys of all resources cached as existing"""
+    cache_file = _existence_cache_file(module)
+    if not cache_file:
+        return set()
+    with _existence_cache_lock:
+        entries = _load_existence_cache_file(cache_file)
+    return set(tuple(cache_key.split("/")) for cache_key in entries)
+
+
+def is_known_to_exist(module, key):
+    """Returns True if resource identified by `key` is cached as existing"""
+    return tuple(key) in get_known_existing(module)
+
+
+def remember_existing(module, keys):
+    """Caches resources identified by `keys` as existing"""
+    cache_file = _existence_cache_file(module)
+    if not cache_file:
+        return
+    now = time.time()
+    with _existence_cache_lock:
+        entries = _load_existence_cache_file(cache_file)
+        entries.update((_existence_cache_key(key), now) for key in keys)
+        _store_existence_cache_file(cache_file, entries)
+
+
+def cached_resource_exists(module, key, getter):
+    """Returns True if resource identified by `key` (tuple of names, e.g.
+    `(region, availability_zone)`) exists, False otherwise.
+    `getter()` is called only if the resource is not known to exist yet and
+    must raise `fusion.rest.ApiException` if the resource does not exist.
+    If ANSIBLE_CACHE_DIR is set, known resources are remembered there for
+    EXISTENCE_CACHE_TTL seconds so that subsequent tasks can skip the lookup."""
+    if is_known_to_exist(module, key):
+        return True
+
+    try:
+        getter()
+    except fusion.rest.ApiException:
+        invalidate_existence_cache(module)
+        return False
+
+    remember_existing(module, [key])
+    return True
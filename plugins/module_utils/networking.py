@@ -42,28 +42,21 @@ _cidr_pattern = re.compile(
 
 def is_valid_network(addr):
     """Returns True if `addr` is IPv4 address/submask in bit CIDR notation, False otherwise."""
-    match = re.match(_cidr_pattern, addr)
-    if match is None:
-        return False
-    for i in range(4):
-        if int(match.group(i + 1)) > 255:
-            return False
-    mask = int(match.group(5))
-    if mask < 8 or mask > 32:
-        return False
-    return True
+    # the pattern itself restricts octets to 0-255 and mask to 8-32
+    return _cidr_pattern.match(addr) is not None
+
+
+def get_invalid_networks(addrs):
+    """Returns list of entries from `addrs` which are not IPv4 address/submask in bit
+    CIDR notation, preserving their order."""
+    return [addr for addr in addrs if not is_valid_network(addr)]
 
 
 def is_valid_address(addr):
     """Returns True if `addr` is a valid IPv4 address, False otherwise. Does not support
     octal/hex notations."""
-    match = re.match(_addr_pattern, addr)
-    if match is None:
-        return False
-    for i in range(4):
-        if int(match.group(i + 1)) > 255:
-            return False
-    return True
+    # the pattern itself restricts octets to 0-255
+    return _addr_pattern.match(addr) is not None
 
 
 def is_address_in_network(addr, network):
@@ -7,8 +7,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import random
 import time
-import math
 
 try:
     import fusion as purefusion
@@ -25,6 +25,25 @@ from ansible_collections.purestorage.fusion.plugins.module_utils.errors import (
     OperationException,
 )
 
+# operations are polled with exponential backoff so that short operations
+# finish fast and long ones do not hammer the API; the delay never exceeds
+# the retry interval suggested by the server
+POLL_INITIAL_DELAY = 0.05
+POLL_MAX_DELAY = 2.0
+
+
+def _get_poll_delay(attempt, retry_in):
+    """Returns the number of seconds to wait before the `attempt`-th poll,
+    `retry_in` is the retry interval (in milliseconds) suggested by the server."""
+    max_delay = POLL_MAX_DELAY
+    if retry_in:
+        max_delay = retry_in / 1000.0
+    # limit the exponent, the delay is capped anyway and huge powers would overflow
+    delay = POLL_INITIAL_DELAY * 2 ** min(attempt, 10)
+    # add jitter before capping so that the cap is never exceeded
+    delay *= 0.8 + 0.4 * random.random()
+    return min(max_delay, delay)
+
 
 def await_operation(module, fusion, operation, fail_playbook_if_operation_fails=True):
     """
@@ -33,6 +52,7 @@ def await_operation(module, fusion, operation, fail_playbook_if_operation_fails=
     """
     op_api = purefusion.OperationsApi(fusion)
     operation_get = None
+    attempt = 0
     while True:
         try:
             operation_get = op_api.get_operation(operation.id)
@@ -44,4 +64,5 @@ def await_operation(module, fusion, operation, fail_playbook_if_operation_fails=
                 return operation_get
         except HTTPError as err:
             raise OperationException(operation, http_error=err)
-        time.sleep(int(math.ceil(operation_get.retry_in / 1000)))
+        time.sleep(_get_poll_delay(attempt, operation_get.retry_in))
+        attempt += 1
@@ -17,6 +17,9 @@ description:
 - Create or delete storage endpoints in Pure Storage Fusion.
 notes:
 - Supports C(check_mode).
+- If C(ANSIBLE_CACHE_DIR) environment variable is set, existence of the availability
+  zone and network interface groups is cached there for 5 minutes so that subsequent
+  tasks can skip the lookups.
 author:
 - Pure Storage Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -70,6 +73,15 @@ options:
     - Address of the subnet gateway.
     - Currently this must be provided.
     type: str
+  verify_prereqs:
+    description:
+    - Check that the availability zone and network interface groups exist before
+      managing the storage endpoint.
+    - Set to C(false) to skip these lookups when they are known to exist, e.g. when
+      they were created by previous tasks.
+    type: bool
+    default: true
+    version_added: '1.4.0'
 extends_documentation_fragment:
 - purestorage.fusion.purestorage.fusion
 """
@@ -103,6 +115,8 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 HAS_FUSION = True
 try:
     import fusion as purefusion
@@ -113,10 +127,14 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.fusion.plugins.module_utils.fusion import (
     get_fusion,
     fusion_argument_spec,
+    cached_resource_exists,
+    invalidate_existence_cache,
+    get_known_existing,
+    remember_existing,
 )
 
 from ansible_collections.purestorage.fusion.plugins.module_utils.networking import (
-    is_valid_network,
+    get_invalid_networks,
 )
 from ansible_collections.purestorage.fusion.plugins.module_utils.errors import (
     install_fusion_exception_hook,
@@ -125,37 +143,84 @@ from ansible_collections.purestorage.fusion.plugins.module_utils.operations impo
     await_operation,
 )
 
+# built once at import time
+_ARGUMENT_SPEC = fusion_argument_spec()
+_ARGUMENT_SPEC.update(
+    dict(
+        name=dict(type="str", required=True),
+        display_name=dict(type="str"),
+        region=dict(type="str", required=True),
+        availability_zone=dict(type="str", required=True, aliases=["az"]),
+        endpoint_type=dict(type="str", default="iscsi", choices=["iscsi"]),
+        addresses=dict(type="list", elements="str"),
+        gateway=dict(type="str"),
+        network_interface_groups=dict(type="list", elements="str"),
+        state=dict(type="str", default="present", choices=["absent", "present"]),
+        verify_prereqs=dict(type="bool", default=True),
+    )
+)
 
-def get_nifg(module, fusion):
-    """Check all Network Interface Groups"""
-    nifg_api_instance = purefusion.NetworkInterfaceGroupsApi(fusion)
-    for group in range(0, len(module.params["network_interface_groups"])):
-        try:
-            nifg_api_instance.get_network_interface_group(
-                region_name=module.params["region"],
-                availability_zone_name=module.params["availability_zone"],
-                provider_subnet=module.params["network_interface_groups"][group],
-            )
-        except purefusion.rest.ApiException:
-            return False
-    return True
 
+def get_nifg(module, nifg_api_instance):
+    """Check all Network Interface Groups"""
+    region = module.params["region"]
+    az = module.params["availability_zone"]
+    wanted = set(module.params["network_interface_groups"])
+    known = get_known_existing(module)
+    if all((region, az, nifg_name) in known for nifg_name in wanted):
+        return True
 
-def get_az(module, fusion):
-    """Availability Zone or None"""
-    az_api_instance = purefusion.AvailabilityZonesApi(fusion)
     try:
-        return az_api_instance.get_availability_zone(
-            availability_zone_name=module.params["availability_zone"],
-            region_name=module.params["region"],
+        nifgs = nifg_api_instance.list_network_interface_groups(
+            region_name=region,
+            availability_zone_name=az,
         )
     except purefusion.rest.ApiException:
-        return None
+        # fall back to checking the groups one by one
+        invalidate_existence_cache(module)
+        return _get_nifg_one_by_one(module, nifg_api_instance)
+
+    existing = set(nifg.name for nifg in nifgs.items)
+    remember_existing(
+        module, [(region, az, nifg_name) for nifg_name in wanted & existing]
+    )
+    return wanted.issubset(existing)
+
+
+def _get_nifg_one_by_one(module, nifg_api_instance):
+    region = module.params["region"]
+    az = module.params["availability_zone"]
+    for nifg_name in module.params["network_interface_groups"]:
+        exists = cached_resource_exists(
+            module,
+            (region, az, nifg_name),
+            lambda: nifg_api_instance.get_network_interface_group(
+                region_name=region,
+                availability_zone_name=az,
+                network_interface_group_name=nifg_name,
+            ),
+        )
+        if not exists:
+            return False
+    return True
 
 
-def get_se(module, fusion):
+def get_az(module, az_api_instance):
+    """Return True if Availability Zone exists, False otherwise"""
+    region = module.params["region"]
+    az = module.params["availability_zone"]
+    return cached_resource_exists(
+        module,
+        (region, az),
+        lambda: az_api_instance.get_availability_zone(
+            availability_zone_name=az,
+            region_name=region,
+        ),
+    )
+
+
+def get_se(module, se_api_instance):
     """Storage Endpoint or None"""
-    se_api_instance = purefusion.StorageEndpointsApi(fusion)
     try:
         return se_api_instance.get_storage_endpoint(
             region_name=module.params["region"],
@@ -166,75 +231,61 @@ def get_se(module, fusion):
         return None
 
 
-def create_se(module, fusion):
+def create_se(module, fusion, se_api_instance):
     """Create Storage Endpoint"""
-
-    se_api_instance = purefusion.StorageEndpointsApi(fusion)
-
-    changed = True
+    params = module.params
+    name = params["name"]
+    display_name = params["display_name"] or name
 
     if not module.check_mode:
-        if not module.params["display_name"]:
-            display_name = module.params["name"]
-        else:
-            display_name = module.params["display_name"]
-        ifaces = []
-        for address in module.params["addresses"]:
-            if module.params["gateway"]:
-                iface = purefusion.StorageEndpointIscsiDiscoveryInterfacePost(
-                    address=address,
-                    gateway=module.params["gateway"],
-                    network_interface_groups=module.params["network_interface_groups"],
-                )
-            else:
-                iface = purefusion.StorageEndpointIscsiDiscoveryInterfacePost(
-                    address=address,
-                    network_interface_groups=module.params["network_interface_groups"],
-                )
-            ifaces.append(iface)
+        nifgs = params["network_interface_groups"]
+        gateway_arg = {}
+        if params["gateway"]:
+            gateway_arg["gateway"] = params["gateway"]
         op = purefusion.StorageEndpointPost(
-            endpoint_type=module.params["endpoint_type"],
+            endpoint_type=params["endpoint_type"],
             iscsi=purefusion.StorageEndpointIscsiPost(
-                discovery_interfaces=ifaces,
+                # has to be a list, the SDK serializer does not accept other iterables
+                discovery_interfaces=[
+                    purefusion.StorageEndpointIscsiDiscoveryInterfacePost(
+                        address=address, network_interface_groups=nifgs, **gateway_arg
+                    )
+                    for address in params["addresses"]
+                ],
             ),
-            name=module.params["name"],
+            name=name,
             display_name=display_name,
         )
         op = se_api_instance.create_storage_endpoint(
             op,
-            region_name=module.params["region"],
-            availability_zone_name=module.params["availability_zone"],
+            region_name=params["region"],
+            availability_zone_name=params["availability_zone"],
         )
         await_operation(module, fusion, op)
 
-    module.exit_json(changed=changed)
+    return True
 
 
-def delete_se(module, fusion):
+def delete_se(module, fusion, se_api_instance):
     """Delete Storage Endpoint"""
-    changed = True
-    se_api_instance = purefusion.StorageEndpointsApi(fusion)
+    params = module.params
     if not module.check_mode:
         op = se_api_instance.delete_storage_endpoint(
-            region_name=module.params["region"],
-            availability_zone_name=module.params["availability_zone"],
-            storage_endpoint_name=module.params["name"],
+            region_name=params["region"],
+            availability_zone_name=params["availability_zone"],
+            storage_endpoint_name=params["name"],
         )
         await_operation(module, fusion, op)
-    module.exit_json(changed=changed)
+    return True
 
 
-def update_se(module, fusion, se):
+def update_se(module, fusion, se_api_instance, se):
     """Update Storage Endpoint"""
-
-    se_api_instance = purefusion.StorageEndpointsApi(fusion)
+    params = module.params
     patches = []
-    if (
-        module.params["display_name"]
-        and module.params["display_name"] != se.display_name
-    ):
+    if params["display_name"] and params["display_name"] != se.display_name:
         patch = purefusion.StorageEndpointPatch(
-            display_name=purefusion.NullableString(module.params["display_name"]),
+            display_name=purefusion.NullableString(params["display_name"]),
         )
         patches.append(patch)
 
@@ -242,71 +293,75 @@ def update_se(module, fusion, se):
         for patch in patches:
             op = se_api_instance.update_storage_endpoint(
                 patch,
-                region_name=module.params["region"],
-                availability_zone_name=module.params["availability_zone"],
-                storage_endpoint_name=module.params["name"],
+                region_name=params["region"],
+                availability_zone_name=params["availability_zone"],
+                storage_endpoint_name=params["name"],
             )
             await_operation(module, fusion, op)
 
-    changed = len(patches) != 0
-
-    module.exit_json(changed=changed)
+    return len(patches) != 0
 
 
 def main():
     """Main code"""
-    argument_spec = fusion_argument_spec()
-    argument_spec.update(
-        dict(
-            name=dict(type="str", required=True),
-            display_name=dict(type="str"),
-            region=dict(type="str", required=True),
-            availability_zone=dict(type="str", required=True, aliases=["az"]),
-            endpoint_type=dict(type="str", default="iscsi", choices=["iscsi"]),
-            addresses=dict(type="list", elements="str"),
-            gateway=dict(type="str"),
-            network_interface_groups=dict(type="list", elements="str"),
-            state=dict(type="str", default="present", choices=["absent", "present"]),
-        )
-    )
-
-    module = AnsibleModule(argument_spec, supports_check_mode=True)
+    module = AnsibleModule(_ARGUMENT_SPEC, supports_check_mode=True)
     install_fusion_exception_hook(module)
 
-    state = module.params["state"]
+    params = module.params
+    state = params["state"]
+    addresses = params["addresses"]
     fusion = get_fusion(module)
-    if not get_az(module, fusion):
+    az_api_instance = purefusion.AvailabilityZonesApi(fusion)
+    nifg_api_instance = purefusion.NetworkInterfaceGroupsApi(fusion)
+    se_api_instance = purefusion.StorageEndpointsApi(fusion)
+
+    # the lookups are independent of each other, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        az_future = None
+        nifg_future = None
+        if params["verify_prereqs"]:
+            az_future = executor.submit(get_az, module, az_api_instance)
+            if params["network_interface_groups"]:
+                nifg_future = executor.submit(get_nifg, module, nifg_api_instance)
+        se_future = executor.submit(get_se, module, se_api_instance)
+
+        az_exists = az_future is None or az_future.result()
+        nifgs_exist = nifg_future is None or nifg_future.result()
+        sendp = se_future.result()
+
+    if not az_exists:
         module.fail_json(
             msg="Availability Zone {0} does not exist".format(
-                module.params["availability_zone"]
+                params["availability_zone"]
             )
         )
-    if module.params["network_interface_groups"] and not get_nifg(module, fusion):
+    if not nifgs_exist:
         module.fail_json(
             msg="Not all of the network interface groups exist in the specified AZ"
         )
-    if module.params["addresses"]:
-        for address in module.params["addresses"]:
-            if not is_valid_network(address):
-                module.fail_json(
-                    msg="'{0}' is not a valid address in CIDR notation".format(address)
+    if addresses:
+        invalid_addresses = get_invalid_networks(addresses)
+        if invalid_addresses:
+            module.fail_json(
+                msg="Addresses not in valid CIDR notation: '{0}'".format(
+                    "', '".join(invalid_addresses)
                 )
+            )
 
-    sendp = get_se(module, fusion)
-
+    changed = False
     if state == "present" and not sendp:
         module.fail_on_missing_params(["addresses"])
-        if not (module.params["addresses"]):
+        if not addresses:
             module.fail_json(
                 msg="At least one entry in 'addresses' is required to create new storage endpoint"
             )
-        create_se(module, fusion)
+        changed = create_se(module, fusion, se_api_instance)
     elif state == "present" and sendp:
-        update_se(module, fusion, sendp)
+        changed = update_se(module, fusion, se_api_instance, sendp)
     elif state == "absent" and sendp:
-        delete_se(module, fusion)
+        changed = delete_se(module, fusion, se_api_instance)
 
-    module.exit_json(changed=False)
+    module.exit_json(changed=changed)
 
 
 if __name__ == "__main__":
@@ -126,6 +126,8 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 HAS_FUSION = True
 try:
     import fusion as purefusion
@@ -148,10 +150,57 @@ from ansible_collections.purestorage.fusion.plugins.module_utils.operations impo
     await_operation,
 )
 
+# built once at import time
+_DEPRECATED_HOSTS = dict(
+    name="hosts", date="2023-07-26", collection_name="purefusion.fusion"
+)
+_ARGUMENT_SPEC = fusion_argument_spec()
+_ARGUMENT_SPEC.update(
+    dict(
+        name=dict(type="str", required=True),
+        display_name=dict(type="str"),
+        rename=dict(
+            type="str",
+            removed_at_date="2023-07-26",
+            removed_from_collection="purestorage.fusion",
+        ),
+        tenant=dict(type="str", required=True),
+        tenant_space=dict(type="str", required=True),
+        placement_group=dict(type="str"),
+        storage_class=dict(type="str"),
+        protection_policy=dict(type="str"),
+        host_access_policies=dict(
+            type="list", elements="str", deprecated_aliases=[_DEPRECATED_HOSTS]
+        ),
+        eradicate=dict(type="bool", default=False),
+        state=dict(type="str", default="present", choices=["absent", "present"]),
+        size=dict(type="str"),
+    )
+)
+_REQUIRED_BY = {
+    "placement_group": "storage_class",
+}
+
+# up to this many host access policies are looked up one by one instead of listing all
+HAP_LOOKUP_LIMIT = 4
+
+# API instances built in this run, keyed by the API class
+_api_instances = {}
+
+
+def get_api(fusion, api_class):
+    """Return instance of `api_class` (e.g. `purefusion.VolumesApi`) for client `fusion`,
+    building it only on first use"""
+    api_instance = _api_instances.get(api_class)
+    if api_instance is None or api_instance.api_client is not fusion:
+        api_instance = api_class(fusion)
+        _api_instances[api_class] = api_instance
+    return api_instance
+
 
 def get_volume(module, fusion):
     """Return Volume or None"""
-    volume_api_instance = purefusion.VolumesApi(fusion)
+    volume_api_instance = get_api(fusion, purefusion.VolumesApi)
     try:
         return volume_api_instance.get_volume(
             tenant_name=module.params["tenant"],
@@ -162,15 +211,15 @@ def get_volume(module, fusion):
         return None
 
 
-def get_storage_class(module, fusion):
-    """Return Storage Class or None"""
-    pg_api_instance = purefusion.PlacementGroupsApi(fusion)
-    pg = pg_api_instance.get_placement_group(
-        tenant_name=module.params["tenant"],
-        tenant_space_name=module.params["tenant_space"],
-        placement_group_name=module.params["placement_group"],
-    )
-    sc_api_instance = purefusion.StorageClassesApi(fusion)
+def get_storage_class(module, fusion, pg=None):
+    """Return Storage Class or None.
+    `pg` is the placement group if it has already been fetched."""
+    if pg is None:
+        pg = get_protection_group(module, fusion)
+    if not pg:
+        # nonexistent placement group is reported by the caller
+        return None
+    sc_api_instance = get_api(fusion, purefusion.StorageClassesApi)
     try:
         return sc_api_instance.get_storage_class(
             storage_service_name=pg.storage_service.name,
@@ -182,7 +231,7 @@ def get_storage_class(module, fusion):
 
 def get_protection_group(module, fusion):
     """Return Placement Group or None"""
-    pg_api_instance = purefusion.PlacementGroupsApi(fusion)
+    pg_api_instance = get_api(fusion, purefusion.PlacementGroupsApi)
     try:
         return pg_api_instance.get_placement_group(
             tenant_name=module.params["tenant"],
@@ -195,7 +244,7 @@ def get_protection_group(module, fusion):
 
 def get_protection_policy(module, fusion):
     """Return Protection Policy or None"""
-    pp_api_instance = purefusion.ProtectionPoliciesApi(fusion)
+    pp_api_instance = get_api(fusion, purefusion.ProtectionPoliciesApi)
     try:
         return pp_api_instance.get_protection_policy(
             protection_policy_name=module.params["protection_policy"]
@@ -206,9 +255,51 @@ def get_protection_policy(module, fusion):
 
 def get_all_haps(fusion):
     """Return set of all existing host access policies or None"""
-    hap_api_instance = purefusion.HostAccessPoliciesApi(fusion)
+    hap_api_instance = get_api(fusion, purefusion.HostAccessPoliciesApi)
     all_haps = hap_api_instance.list_host_access_policies()
-    return set([hap.name for hap in all_haps.items])
+    return {hap.name for hap in all_haps.items}
+
+
+def hap_exists(fusion, name):
+    """Return True if host access policy exists"""
+    hap_api_instance = get_api(fusion, purefusion.HostAccessPoliciesApi)
+    try:
+        hap_api_instance.get_host_access_policy(host_access_policy_name=name)
+        return True
+    except purefusion.rest.ApiException as exc:
+        # only "not found" means missing, let anything else reach the exception hook
+        if exc.status != 404:
+            raise
+        return False
+
+
+def get_existing_haps(module, fusion):
+    """Return set of wanted host access policies that exist.
+    Few policies are looked up one by one, otherwise all policies are listed."""
+    wanted_haps = get_wanted_haps(module)
+    if not wanted_haps:
+        return set()
+    if len(wanted_haps) > HAP_LOOKUP_LIMIT:
+        return get_all_haps(fusion)
+    with ThreadPoolExecutor(max_workers=len(wanted_haps)) as executor:
+        futures = dict(
+            (name, executor.submit(hap_exists, fusion, name)) for name in wanted_haps
+        )
+    return {name for name, future in futures.items() if future.result()}
+
+
+# sizes already parsed in this run, keyed by the size string
+_size_cache = {}
+
+
+def get_wanted_size(module):
+    """Return requested volume size in bytes or None if not provided"""
+    size = module.params["size"]
+    if not size:
+        return None
+    if size not in _size_cache:
+        _size_cache[size] = parse_number_with_metric_suffix(module, size)
+    return _size_cache[size]
 
 
 def get_wanted_haps(module):
@@ -216,27 +307,24 @@ def get_wanted_haps(module):
     if not module.params["host_access_policies"]:
         return set()
     # looks like yaml parsing can leave in some spaces if coma-delimited .so strip() the names
-    return set([hap.strip() for hap in module.params["host_access_policies"]])
+    return {hap.strip() for hap in module.params["host_access_policies"]}
 
 
 def extract_current_haps(volume):
     """Return set of host access policies that volume currently has"""
     if not volume.host_access_policies:
         return set()
-    return set([hap.name for hap in volume.host_access_policies])
+    return {hap.name for hap in volume.host_access_policies}
 
 
 def create_volume(module, fusion):
     """Create Volume"""
 
-    size = parse_number_with_metric_suffix(module, module.params["size"])
+    size = get_wanted_size(module)
 
     if not module.check_mode:
-        if not module.params["display_name"]:
-            display_name = module.params["name"]
-        else:
-            display_name = module.params["display_name"]
-        volume_api_instance = purefusion.VolumesApi(fusion)
+        display_name = module.params["display_name"] or module.params["name"]
+        volume_api_instance = get_api(fusion, purefusion.VolumesApi)
         volume = purefusion.VolumePost(
             size=size,
             storage_class=module.params["storage_class"],
@@ -261,8 +349,12 @@ def update_host_access_policies(module, fusion, current, patches):
         current_haps = extract_current_haps(current)
         wanted_haps = get_wanted_haps(module)
         if wanted_haps != current_haps:
+            # send the policies in the order they were given, without duplicates
+            ordered_haps = dict.fromkeys(
+                hap.strip() for hap in wanted["host_access_policies"]
+            )
             patch = purefusion.VolumePatch(
-                host_access_policies=purefusion.NullableString(",".join(wanted_haps))
+                host_access_policies=purefusion.NullableString(",".join(ordered_haps))
             )
             patches.append(patch)
 
@@ -318,7 +410,7 @@ def update_placement_group(module, fusion, current, patches):
 def update_size(module, fusion, current, patches):
     wanted = module.params
     if wanted["size"]:
-        wanted_size = parse_number_with_metric_suffix(module, wanted["size"])
+        wanted_size = get_wanted_size(module)
         if wanted_size != current.size:
             patch = purefusion.VolumePatch(size=purefusion.NullableSize(wanted_size))
             patches.append(patch)
@@ -326,9 +418,11 @@ def update_size(module, fusion, current, patches):
 
 def update_protection_policy(module, fusion, current, patches):
     wanted = module.params
+    # volume does not have to have any protection policy
+    current_protection_policy = getattr(current.protection_policy, "name", None)
     if (
         wanted["protection_policy"]
-        and wanted["protection_policy"] != current.protection_policy.name
+        and wanted["protection_policy"] != current_protection_policy
     ):
         patch = purefusion.VolumePatch(
             protection_policy=purefusion.NullableString(wanted["protection_policy"])
@@ -336,8 +430,37 @@ def update_protection_policy(module, fusion, current, patches):
         patches.append(patch)
 
 
+def is_properties_update_requested(module):
+    """Return True if any of the updatable volume properties was provided"""
+    params = module.params
+    # empty list of host access policies is a request to remove all of them
+    return params["host_access_policies"] is not None or any(
+        params[name]
+        for name in (
+            "size",
+            "protection_policy",
+            "display_name",
+            "storage_class",
+            "placement_group",
+        )
+    )
+
+
+def get_properties_patches(module, fusion, current):
+    """Return list of patches, one for each volume property that differs,
+    in the order they have to be applied"""
+    patches = []
+    update_size(module, fusion, current, patches)
+    update_protection_policy(module, fusion, current, patches)
+    update_display_name(module, fusion, current, patches)
+    update_storage_class(module, fusion, current, patches)
+    update_placement_group(module, fusion, current, patches)
+    update_host_access_policies(module, fusion, current, patches)
+    return patches
+
+
 def apply_patches(module, fusion, patches):
-    volume_api_instance = purefusion.VolumesApi(fusion)
+    volume_api_instance = get_api(fusion, purefusion.VolumesApi)
     for patch in patches:
         op = volume_api_instance.update_volume(
             patch,
@@ -348,9 +471,11 @@ def apply_patches(module, fusion, patches):
         await_operation(module, fusion, op)
 
 
-def update_volume(module, fusion):
-    """Update Volume size, placement group, protection policy, storage class, HAPs"""
-    current = get_volume(module, fusion)
+def update_volume(module, fusion, current=None):
+    """Update Volume size, placement group, protection policy, storage class, HAPs.
+    `current` is the already fetched volume, it is fetched again if not provided."""
+    if current is None:
+        current = get_volume(module, fusion)
     patches = []
 
     if not current:
@@ -365,24 +490,19 @@ def update_volume(module, fusion):
         # result from update_volume() would not change it.
         return False
 
+    destroyed_matches = current.destroyed == (module.params["state"] != "present")
+    if destroyed_matches and not is_properties_update_requested(module):
+        # nothing to update, typical for idempotent re-runs
+        return False
+
     # volumes with 'destroyed' flag are kinda special because we can't change
     # most of their properties while in this state, so we need to set it last
     # and unset it first if changed, respectively
     if module.params["state"] == "present":
         update_destroyed(module, fusion, current, patches)
-        update_size(module, fusion, current, patches)
-        update_protection_policy(module, fusion, current, patches)
-        update_display_name(module, fusion, current, patches)
-        update_storage_class(module, fusion, current, patches)
-        update_placement_group(module, fusion, current, patches)
-        update_host_access_policies(module, fusion, current, patches)
+        patches += get_properties_patches(module, fusion, current)
     elif module.params["state"] == "absent" and not current.destroyed:
-        update_size(module, fusion, current, patches)
-        update_protection_policy(module, fusion, current, patches)
-        update_display_name(module, fusion, current, patches)
-        update_storage_class(module, fusion, current, patches)
-        update_placement_group(module, fusion, current, patches)
-        update_host_access_policies(module, fusion, current, patches)
+        patches += get_properties_patches(module, fusion, current)
         update_destroyed(module, fusion, current, patches)
 
     if not module.check_mode:
@@ -407,7 +527,7 @@ def eradicate_volume(module, fusion):
             msg="BUG: inconsistent state, eradicate_volume() cannot be called with current.destroyed=False or any host_access_policies"
         )
 
-    volume_api_instance = purefusion.VolumesApi(fusion)
+    volume_api_instance = get_api(fusion, purefusion.VolumesApi)
     op = volume_api_instance.delete_volume(
         volume_name=module.params["name"],
         tenant_name=module.params["tenant"],
@@ -418,28 +538,92 @@ def eradicate_volume(module, fusion):
     return True
 
 
-def validate_arguments(module, fusion):
+def get_unchanged_resources(module, volume):
+    """Return dict of resources referenced by the arguments that the volume already
+    uses, keyed by the argument name. These are known to exist and don't need to be
+    looked up."""
+    if not volume:
+        return {}
+    params = module.params
+    resources = {}
+    pg_unchanged = params["placement_group"] in (None, volume.placement_group.name)
+    if params["placement_group"] and pg_unchanged:
+        resources["placement_group"] = volume.placement_group
+    # storage class is looked up in the storage service of the placement group
+    if pg_unchanged and params["storage_class"] == volume.storage_class.name:
+        resources["storage_class"] = volume.storage_class
+    current_pp = getattr(volume.protection_policy, "name", None)
+    if params["protection_policy"] and params["protection_policy"] == current_pp:
+        resources["protection_policy"] = volume.protection_policy
+    if params["host_access_policies"] is not None:
+        current_haps = extract_current_haps(volume)
+        if get_wanted_haps(module) <= current_haps:
+            resources["host_access_policies"] = current_haps
+    return resources
+
+
+def get_referenced_resources(module, fusion, volume):
+    """Return dict of resources referenced by the arguments, keyed by the argument name.
+    The lookups run concurrently."""
+    resources = get_unchanged_resources(module, volume)
+    futures = {}
+
+    def get_storage_class_in_pg(module, fusion):
+        # storage class is looked up in the storage service of the placement group,
+        # wait for the placement group lookup instead of fetching it again
+        if "placement_group" not in futures:
+            return get_storage_class(module, fusion)
+        pg = futures["placement_group"].result()
+        if not pg:
+            # nonexistent placement group is reported by the caller
+            return None
+        return get_storage_class(module, fusion, pg)
+
+    lookups = {}
+    if module.params["placement_group"]:
+        lookups["placement_group"] = get_protection_group
+    if module.params["storage_class"]:
+        lookups["storage_class"] = get_storage_class_in_pg
+    if module.params["protection_policy"]:
+        lookups["protection_policy"] = get_protection_policy
+    if module.params["host_access_policies"] is not None:
+        lookups["host_access_policies"] = get_existing_haps
+    for name in resources:
+        del lookups[name]
+    if not lookups:
+        return resources
+
+    # placement group is submitted before storage class, which may wait for it
+    with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+        for name, lookup in lookups.items():
+            futures[name] = executor.submit(lookup, module, fusion)
+    resources.update((name, future.result()) for name, future in futures.items())
+    return resources
+
+
+def validate_arguments(module, fusion, volume):
     """Validates most argument conditions and possible unacceptable argument combinations"""
-    volume = get_volume(module, fusion)
     state = module.params["state"]
 
     if state == "present" and not volume:
         module.fail_on_missing_params(["placement_group", "storage_class", "size"])
 
-    if module.params["placement_group"] and not get_protection_group(module, fusion):
+    resources = get_referenced_resources(module, fusion, volume)
+
+    if module.params["placement_group"] and not resources["placement_group"]:
         module.fail_json(
             msg="Placement Group '{0}' does not exist in the provided "
             "tenant and tenant name space".format(module.params["placement_group"])
         )
 
-    if module.params["storage_class"] and not get_storage_class(module, fusion):
+    if module.params["storage_class"] and not resources["storage_class"]:
         module.fail_json(
             msg="Storage Class '{0}' does not exist".format(
                 module.params["storage_class"]
             )
         )
 
-    if module.params["protection_policy"] and not get_protection_policy(module, fusion):
+    if module.params["protection_policy"] and not resources["protection_policy"]:
         module.fail_json(
             msg="Protection Policy '{0}' does not exist".format(
                 module.params["protection_policy"]
@@ -447,12 +631,11 @@ def validate_arguments(module, fusion):
         )
 
     if module.params["host_access_policies"] is not None:
-        existing_haps = get_all_haps(fusion)
-        wanted_haps = get_wanted_haps(module)
-        if not (wanted_haps <= existing_haps):
+        missing_haps = get_wanted_haps(module) - resources["host_access_policies"]
+        if missing_haps:
             module.fail_json(
                 msg="To-be-assigned host access policies '{0}' don't exist".format(
-                    wanted_haps - existing_haps
+                    "', '".join(sorted(missing_haps))
                 )
             )
 
@@ -478,8 +661,8 @@ def validate_arguments(module, fusion):
     if state == "present" and not volume:
         # would create a volume; check size is lower than storage class limit
         # (let resize checks be handled by the server since they are more complicated)
-        size = parse_number_with_metric_suffix(module, module.params["size"])
-        size_limit = get_storage_class(module, fusion).size_limit
+        size = get_wanted_size(module)
+        size_limit = resources["storage_class"].size_limit
         if size > size_limit:
             module.fail_json(
                 msg="Requested volume size {0} exceeds the storage class limit of {1}".format(
@@ -491,40 +674,9 @@ def validate_arguments(module, fusion):
 
 def main():
     """Main code"""
-    argument_spec = fusion_argument_spec()
-    deprecated_hosts = dict(
-        name="hosts", date="2023-07-26", collection_name="purefusion.fusion"
-    )
-    argument_spec.update(
-        dict(
-            name=dict(type="str", required=True),
-            display_name=dict(type="str"),
-            rename=dict(
-                type="str",
-                removed_at_date="2023-07-26",
-                removed_from_collection="purestorage.fusion",
-            ),
-            tenant=dict(type="str", required=True),
-            tenant_space=dict(type="str", required=True),
-            placement_group=dict(type="str"),
-            storage_class=dict(type="str"),
-            protection_policy=dict(type="str"),
-            host_access_policies=dict(
-                type="list", elements="str", deprecated_aliases=[deprecated_hosts]
-            ),
-            eradicate=dict(type="bool", default=False),
-            state=dict(type="str", default="present", choices=["absent", "present"]),
-            size=dict(type="str"),
-        )
-    )
-
-    required_by = {
-        "placement_group": "storage_class",
-    }
-
     module = AnsibleModule(
-        argument_spec,
-        required_by=required_by,
+        _ARGUMENT_SPEC,
+        required_by=_REQUIRED_BY,
         supports_check_mode=True,
     )
 
@@ -535,16 +687,17 @@ def main():
 
     volume = get_volume(module, fusion)
 
-    validate_arguments(module, fusion)
-
     if state == "absent" and not volume:
+        # nothing to do, no need to validate the rest of the arguments either
         module.exit_json(changed=False)
 
+    validate_arguments(module, fusion, volume)
+
     changed = False
     if state == "present" and not volume:
         changed = changed | create_volume(module, fusion)
     # volume might exist even if soft-deleted, so we still have to update it
-    changed = changed | update_volume(module, fusion)
+    changed = changed | update_volume(module, fusion, volume)
     if module.params["eradicate"]:
         changed = changed | eradicate_volume(module, fusion)
 
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import time
+
+import fusion as purefusion
+import pytest
+
+from ansible_collections.purestorage.fusion.plugins.module_utils.fusion import (
+    EXISTENCE_CACHE_TTL,
+    cached_resource_exists,
+    get_known_existing,
+    is_known_to_exist,
+    remember_existing,
+)
+
+
+class MockModule:
+    def __init__(self, app_id="APP"):
+        self.params = {"app_id": app_id}
+
+
+class MockGetter:
+    def __init__(self, exists=True):
+        self.exists = exists
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if not self.exists:
+            raise purefusion.rest.ApiException(status=404)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANSIBLE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def cache_files(cache_dir):
+    return [os.path.join(str(cache_dir), name) for name in os.listdir(str(cache_dir))]
+
+
+def test_disabled_without_cache_dir(monkeypatch):
+    monkeypatch.delenv("ANSIBLE_CACHE_DIR", raising=False)
+    module = MockModule()
+    getter = MockGetter()
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert getter.calls == 2
+    remember_existing(module, [("region", "az")])
+    assert not is_known_to_exist(module, ("region", "az"))
+
+
+def test_remembered(cache_dir):
+    module = MockModule()
+    getter = MockGetter()
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert getter.calls == 1
+    assert is_known_to_exist(module, ("region", "az"))
+    assert not is_known_to_exist(module, ("region", "other"))
+    # each app id has its own cache
+    assert not is_known_to_exist(MockModule("OTHER"), ("region", "az"))
+
+
+def test_known_existing(cache_dir):
+    module = MockModule()
+    assert get_known_existing(module) == set()
+    remember_existing(module, [("region", "az"), ("region", "az", "nig")])
+    assert get_known_existing(module) == set(
+        [("region", "az"), ("region", "az", "nig")]
+    )
+
+
+def test_separate_per_host(cache_dir, monkeypatch):
+    module = MockModule()
+    monkeypatch.setenv("FUSION_HOST", "https://staging.example.com")
+    remember_existing(module, [("region", "az")])
+    assert is_known_to_exist(module, ("region", "az"))
+    monkeypatch.setenv("FUSION_HOST", "https://prod.example.com")
+    assert not is_known_to_exist(module, ("region", "az"))
+    monkeypatch.delenv("FUSION_HOST")
+    assert not is_known_to_exist(module, ("region", "az"))
+
+
+def test_file_name_hides_app_id(cache_dir):
+    remember_existing(MockModule("SECRET"), [("region", "az")])
+    files = cache_files(cache_dir)
+    assert len(files) == 1
+    assert "SECRET" not in files[0]
+
+
+def test_ttl_expiry(cache_dir, monkeypatch):
+    module = MockModule()
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    remember_existing(module, [("region", "az")])
+    monkeypatch.setattr(time, "time", lambda: now + EXISTENCE_CACHE_TTL - 1)
+    assert is_known_to_exist(module, ("region", "az"))
+    monkeypatch.setattr(time, "time", lambda: now + EXISTENCE_CACHE_TTL)
+    assert not is_known_to_exist(module, ("region", "az"))
+
+    getter = MockGetter()
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert getter.calls == 1
+
+
+def test_invalidated_on_api_exception(cache_dir):
+    module = MockModule()
+    remember_existing(module, [("region", "az"), ("region", "az", "nig")])
+    assert not cached_resource_exists(module, ("region", "gone"), MockGetter(False))
+    assert not is_known_to_exist(module, ("region", "az"))
+    assert not is_known_to_exist(module, ("region", "az", "nig"))
+    assert cache_files(cache_dir) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "not json",
+        "[1, 2]",
+        "42",
+        '{"region/az": "yesterday"}',
+        '{"region/az": null}',
+    ],
+)
+def test_corrupt_file(cache_dir, content):
+    module = MockModule()
+    # create the cache file, then overwrite its content
+    remember_existing(module, [])
+    cache_file = cache_files(cache_dir)[0]
+    with open(cache_file, "w") as f:
+        f.write(content)
+
+    assert not is_known_to_exist(module, ("region", "az"))
+    getter = MockGetter()
+    assert cached_resource_exists(module, ("region", "az"), getter)
+    assert getter.calls == 1
+    with open(cache_file) as f:
+        assert list(json.load(f)) == ["region/az"]
@@ -11,6 +11,7 @@ from ansible_collections.purestorage.fusion.plugins.module_utils.networking impo
     is_valid_address,
     is_valid_network,
     is_address_in_network,
+    get_invalid_networks,
 )
 
 
@@ -46,6 +47,18 @@ def test_invalid_network():
     assert not is_valid_network("1.1.1.1/1")
     assert not is_valid_network("1.1.1.1/7")
     assert not is_valid_network("1.1.1.1/33")
+    assert not is_valid_network("256.1.1.1/24")
+    assert not is_valid_network("1.1.1.256/24")
+    assert not is_valid_network("01.1.1.1/24")
+    assert not is_valid_network("1.1.1.1/08")
+
+
+def test_get_invalid_networks():
+    assert get_invalid_networks([]) == []
+    assert get_invalid_networks(["1.1.1.1/24", "10.0.0.0/8"]) == []
+    assert get_invalid_networks(
+        ["1.1.1.1", "1.1.1.1/24", "1.1.1.1/33", "hostname"]
+    ) == ["1.1.1.1", "1.1.1.1/33", "hostname"]
 
 
 def test_address_is_in_network():
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import random
+
+import pytest
+
+from ansible_collections.purestorage.fusion.plugins.module_utils.operations import (
+    _get_poll_delay,
+)
+
+
+@pytest.fixture(params=[0.0, 0.5, 0.999999])
+def jitter(request, monkeypatch):
+    monkeypatch.setattr(random, "random", lambda: request.param)
+
+
+def test_poll_delay_grows_from_initial_delay(jitter):
+    for attempt in range(5):
+        expected = 0.05 * 2**attempt
+        for retry_in in (None, 10000):
+            delay = _get_poll_delay(attempt, retry_in)
+            assert 0.8 * expected <= delay <= 1.2 * expected
+
+
+def test_poll_delay_capped_by_retry_in(jitter):
+    for attempt in range(20):
+        assert _get_poll_delay(attempt, 300) <= 0.3
+    assert _get_poll_delay(10, 300) == 0.3
+
+
+def test_poll_delay_default_cap(jitter):
+    for retry_in in (0, None):
+        for attempt in range(20):
+            assert _get_poll_delay(attempt, retry_in) <= 2.0
+        assert _get_poll_delay(10, retry_in) == 2.0
+
+
+def test_poll_delay_huge_attempt(jitter):
+    assert _get_poll_delay(10**6, None) <= 2.0